@@ -11,6 +11,9 @@ This is the master game runner. It supports these command-line arguments:
                     If specified, turns off the random ship generation.
                     If not specified, a random ship configuration is generated
                     (until at least 30% of the playing field is filled).
+  -r X             : Redraw each board every X moves of its attacker (default=1, 0 disables the gui).
+  -j X             : Number of worker processes (default=1). With more than one,
+                    battles run in parallel without gui or logs (0 = one per CPU core).
 
 The master runner initializes both players' boards & strategies (using their submissions)
 and then runs the battle logic—using its own game state to determine hits, sunk ships, etc.—while
@@ -18,9 +21,11 @@ also informing the players' strategy modules of the results.
 """
 
 import argparse
+import contextlib
+import multiprocessing as mp
 import sys
-import random
 import matplotlib.pyplot as plt
+import numpy as np
 import time
 import os
 
@@ -34,56 +39,95 @@ from player_2.strategy.strategy import Strategy as ST2
 # Helper functions
 # --------------------------
 
-def get_ship_instances(board: list[list[int]]) -> list[dict]:
+def _label_ships(board: np.ndarray) -> np.ndarray:
     """
-    Given a 2D board (list of lists of ints), identify each ship instance
-    as a connected (orthogonally) component of nonzero cells.
-    Returns a list of dictionaries, each with keys:
-      - "ship_id": the ship type (int)
-      - "coords" : a set of (x, y) coordinates belonging to this ship.
-      - "hits"   : an initially empty set that will track attacked cells.
+    Labels the orthogonally connected components of equal nonzero cells of a 2D
+    uint8 board. Returns an int32 array of the board's shape where every ship cell
+    holds 1 + the smallest flat index (y*width + x) of its component, and water is 0.
+
+    Each cell starts with its own label and repeatedly takes the minimum over its
+    neighbours of the same ship; this converges after as many whole-board passes as
+    the longest path inside a ship. Neighbours are taken with slices rather than
+    np.roll, which would wrap labels around the board edges.
+    """
+    rows, cols = board.shape
+    labels = np.arange(1, rows * cols + 1, dtype=np.int32).reshape(rows, cols)
+    labels[board == 0] = 0
+    # Whether a cell belongs to the same ship as its right / lower neighbour
+    join_x = (board[:, :-1] != 0) & (board[:, :-1] == board[:, 1:])
+    join_y = (board[:-1, :] != 0) & (board[:-1, :] == board[1:, :])
+    while True:
+        merged = labels.copy()
+        np.minimum(merged[:, :-1], np.where(join_x, labels[:, 1:], merged[:, :-1]), out=merged[:, :-1])
+        np.minimum(merged[:, 1:], np.where(join_x, labels[:, :-1], merged[:, 1:]), out=merged[:, 1:])
+        np.minimum(merged[:-1, :], np.where(join_y, labels[1:, :], merged[:-1, :]), out=merged[:-1, :])
+        np.minimum(merged[1:, :], np.where(join_y, labels[:-1, :], merged[1:, :]), out=merged[1:, :])
+        if np.array_equal(merged, labels):
+            return labels
+        labels = merged
+
+def get_ship_instances(board) -> tuple[list[dict], list[int]]:
     """
-    rows = len(board)
-    cols = len(board[0]) if rows else 0
-    visited = set()
+    Given a 2D board (anything convertible to a NumPy array of ints), identify each
+    ship instance as a connected (orthogonally) component of equal nonzero cells.
+    Returns a tuple (instances, cell_owner) where:
+      - instances is a list of dictionaries (in row-major order of their first cell),
+        each with keys:
+          - "ship_id"  : the ship type (int)
+          - "coords"   : a frozenset of (x, y) coordinates belonging to this ship.
+          - "hits"     : an initially empty set that will track attacked cells
+                         (as flat indices y*width + x).
+          - "remaining": the number of cells not hit yet.
+      - cell_owner is a flat list indexed by y*width + x holding k+1 for cells of
+        instances[k] and 0 for water.
+    """
+    board = np.asarray(board, dtype=np.uint8)
+    cols = board.shape[1]
+    flat_labels = _label_ships(board).ravel()
+
+    # Group the ship cells by label: sorting by label keeps each component contiguous
+    cells = np.flatnonzero(flat_labels)
+    cells = cells[np.argsort(flat_labels[cells], kind="stable")]
+    _, starts = np.unique(flat_labels[cells], return_index=True)
+    ship_ids = board.ravel()[cells[starts]].tolist()
+
     instances = []
+    for ship_id, component in zip(ship_ids, np.split(cells, starts[1:])):
+        ys, xs = np.divmod(component, cols)
+        coords = frozenset(zip(xs.tolist(), ys.tolist()))
+        instances.append({"ship_id": ship_id, "coords": coords, "hits": set(), "remaining": len(coords)})
+
+    owner = np.zeros(flat_labels.size, dtype=np.int64)
+    owner[cells] = np.repeat(np.arange(1, len(instances) + 1), np.diff(np.append(starts, len(cells))))
+    return instances, owner.tolist()
+
+def _cell_index(x: int, y: int, width: int, height: int) -> int:
+    """
+    Returns the flat index y*width + x of board coordinate (x, y).
+    Raises an IndexError if the coordinates are out of bounds.
+    """
+    if not (0 <= x < width and 0 <= y < height):
+        raise IndexError(f"Coordinates out of bounds: ({x},{y})")
+    return y * width + x
 
-    for y in range(rows):
-        for x in range(cols):
-            if board[y][x] != 0 and (x, y) not in visited:
-                ship_id = board[y][x]
-                stack = [(x, y)]
-                component = set()
-                while stack:
-                    cx, cy = stack.pop()
-                    if (cx, cy) in component:
-                        continue
-                    component.add((cx, cy))
-                    visited.add((cx, cy))
-                    for dx, dy in [(1,0), (-1,0), (0,1), (0,-1)]:
-                        nx, ny = cx+dx, cy+dy
-                        if 0 <= nx < cols and 0 <= ny < rows:
-                            if board[ny][nx] == ship_id and (nx, ny) not in component:
-                                stack.append((nx, ny))
-                instances.append({"ship_id": ship_id, "coords": component, "hits": set()})
-    return instances
-
-def process_attack(x: int, y: int, ship_instances: list[dict]) -> tuple[bool, bool]:
+def process_attack(cell: int, ship_instances: list[dict], cell_owner: list[int]) -> tuple[bool, bool]:
     """
-    Given an attack coordinate (x,y) and a list of ship instances (each a dict with keys
-    "coords" and "hits"), determine whether the attack is a hit, and whether it sinks
-    one of the ships.
-    Marks the cell as hit in the corresponding ship instance if found.
+    Given an attacked cell (flat index y*width + x), a list of ship instances and the
+    cell_owner list returned by get_ship_instances(), determine whether the attack is
+    a hit, and whether it sinks one of the ships.
+    Marks the cell as hit in the corresponding ship instance if found. Attacking an
+    already hit cell is reported as a hit that sinks nothing.
     Returns a tuple (hit, sunk).
     """
-    for ship in ship_instances:
-        if (x, y) in ship["coords"]:
-            ship["hits"].add((x, y))
-            if ship["hits"] == ship["coords"]:
-                return True, True
-            else:
-                return True, False
-    return False, False
+    owner = cell_owner[cell]
+    if not owner:
+        return False, False
+    ship = ship_instances[owner - 1]
+    if cell in ship["hits"]:
+        return True, False
+    ship["hits"].add(cell)
+    ship["remaining"] -= 1
+    return True, ship["remaining"] == 0
 
 def generate_random_ships(width: int, height: int) -> list[int]:
     """
@@ -94,14 +138,12 @@ def generate_random_ships(width: int, height: int) -> list[int]:
       ID1: 2, ID2: 3, ID3: 4, ID4: 4, ID5: 4, ID6: 4, ID7: 6.
     """
     target = int(width * height * 0.3)
-    tile_counts = {1: 2, 2: 3, 3: 4, 4: 4, 5: 4, 6: 4, 7: 6}
-    ship_counts = {i: 0 for i in range(1,8)}
-    total_tiles = 0
-    while total_tiles < target:
-        ship_type = random.randint(1,7)
-        ship_counts[ship_type] += 1
-        total_tiles += tile_counts[ship_type]
-    return [ship_counts[i] for i in range(1,8)]
+    tile_counts = np.array([2, 3, 4, 4, 4, 4, 6])
+    # Every ship has at least 2 tiles, so target // 2 + 1 picks always reach the target.
+    picks = np.random.randint(0, 7, size=target // 2 + 1)
+    total_tiles = np.concatenate(([0], np.cumsum(tile_counts[picks])))
+    ship_count = int(np.searchsorted(total_tiles, target))
+    return np.bincount(picks[:ship_count], minlength=7).tolist()
 
 def draw_board(board, title="", filename=None):
     """Vykreslí herní plochu s loděmi"""
@@ -109,73 +151,69 @@ def draw_board(board, title="", filename=None):
         # Initialize figures dictionary if it doesn't exist
         draw_board.figures = {}
         plt.ion()  # Turn on interactive mode
-    
-    if title not in draw_board.figures:
+
+    # Hits stay 8, misses (marked 9 by the game loop) are shown as 10
+    board = np.asarray(board)
+    visual_board = np.where(board == 9, 10, board)
+
+    # Figures are pooled by title and reused across moves and battles; one whose
+    # window has been closed (or that plt.close('all') released) is created anew
+    if title not in draw_board.figures or not plt.fignum_exists(draw_board.figures[title][0].number):
         # Create new figure if it doesn't exist
         fig, ax = plt.subplots(figsize=(8, 8))
         fig.canvas.manager.set_window_title(title)  # Set unique window title
-        draw_board.figures[title] = (fig, ax)
+
+        # Create a custom colormap
+        from matplotlib.colors import ListedColormap
+        colors = [
+            'white',        # 0: Empty
+            'blue',         # 1: Ship ID 1
+            'blue',         # 2: Ship ID 2
+            'blue',         # 3: Ship ID 3
+            'blue',         # 4: Ship ID 4
+            'blue',         # 5: Ship ID 5
+            'blue',         # 6: Ship ID 6
+            'blue',         # 7: Ship ID 7
+            'lime',         # 8: Hit
+            'darkgreen',    # 9: Hit and Sunk
+            'red'           # 10: Miss
+        ]
+        cmap = ListedColormap(colors)
+
+        # Draw the image once; later calls only swap its data
+        im = ax.imshow(visual_board, cmap=cmap, vmin=0, vmax=10)
+        ax.set_title(title)
+        ax.grid(color='black', linestyle='--', linewidth=0.5)
+        draw_board.figures[title] = (fig, ax, im)
         plt.show(block=False)
         plt.pause(0.1)  # Allow time for window to appear
     else:
-        # Use existing figure
-        fig, ax = draw_board.figures[title]
-    
-    # Clear previous content
-    ax.clear()
-    
-    # Create a custom colormap
-    from matplotlib.colors import ListedColormap
-    colors = [
-        'white',        # 0: Empty
-        'blue',         # 1: Ship ID 1
-        'blue',         # 2: Ship ID 2
-        'blue',         # 3: Ship ID 3
-        'blue',         # 4: Ship ID 4
-        'blue',         # 5: Ship ID 5
-        'blue',         # 6: Ship ID 6
-        'blue',         # 7: Ship ID 7
-        'lime',         # 8: Hit
-        'darkgreen',    # 9: Hit and Sunk
-        'red'           # 10: Miss
-    ]
-    cmap = ListedColormap(colors)
-    
-    # Create a copy of the board for visualization
-    visual_board = [row.copy() for row in board]
-    
-    # Mark hits (8), sunk ships (9), and misses (10)
-    for y in range(len(visual_board)):
-        for x in range(len(visual_board[y])):
-            if visual_board[y][x] == 8:  # Hit
-                visual_board[y][x] = 8
-            elif visual_board[y][x] == 9:  # Miss
-                visual_board[y][x] = 10
-            # Sunk ships are already marked as 9 in the board logic
-    
-    # Draw new content
-    im = ax.imshow(visual_board, cmap=cmap, vmin=0, vmax=10)
-    ax.set_title(title)
-    ax.grid(color='black', linestyle='--', linewidth=0.5)
-    
+        # Reuse existing figure and image
+        fig, ax, im = draw_board.figures[title]
+        im.set_data(visual_board)
+
     # Update the figure
-    fig.canvas.draw()
+    fig.canvas.draw_idle()
     fig.canvas.flush_events()
     
     # Save to file if requested
     if filename:
-        plt.savefig(filename)
+        fig.savefig(filename)
+
+def log_move(log_fh, move_num, player, x, y, hit, sunk):
+    """Zapíše informace o tahu do otevřeného log souboru"""
+    log_fh.write(f"Move {move_num}: Player {player} attacks ({x},{y}) -> {'Hit' if hit else 'Miss'}{' and Sunk' if sunk else ''}\n")
 
-def log_move(log_file, move_num, player, x, y, hit, sunk):
-    """Zapíše informace o tahu do log souboru"""
-    with open(log_file, 'a') as f:
-        f.write(f"Move {move_num}: Player {player} attacks ({x},{y}) -> {'Hit' if hit else 'Miss'}{' and Sunk' if sunk else ''}\n")
+def _snapshot_path(moves_dir: str | None, name: str) -> str | None:
+    """Returns the path for a board snapshot, or None when snapshots are not saved."""
+    return os.path.join(moves_dir, name) if moves_dir else None
 
 # --------------------------
 # Battle simulation function
 # --------------------------
 
-def simulate_battle(verbose: bool, width: int, height: int, ship_counts: list[int], starting_player: int) -> tuple[int, int]:
+def simulate_battle(verbose: bool, width: int, height: int, ship_counts: list[int], starting_player: int,
+                    render_every: int = 0, log_root: str | None = None) -> tuple[int, int]:
     """
     Simulate one battle between two players.
     
@@ -184,6 +222,12 @@ def simulate_battle(verbose: bool, width: int, height: int, ship_counts: list[in
       width, height : Board dimensions.
       ship_counts   : List of 7 integers for ship counts for IDs 1..7.
       starting_player: 1 or 2; which player starts the battle.
+      render_every  : Redraw (and save) the attacked board every N moves of its attacker
+                      and at the end of the battle; 0 disables drawing entirely.
+      log_root      : Path prefix for this battle's logs; None disables all log files. With
+                      render_every set it is a directory (created if needed) holding the log
+                      and board snapshots, otherwise the log is written to log_root + ".txt"
+                      in an already existing directory.
     
     Returns:
       (winner, moves) where:
@@ -200,80 +244,114 @@ def simulate_battle(verbose: bool, width: int, height: int, ship_counts: list[in
     # Initialize Player 1:
     p1_bs = BS1(height, width, ships_dict)
     p1_bs.place_ships()
-    p1_board = p1_bs.get_board()
+    # Flat board (index y*width + x) for the game loop plus a 2D view of it for drawing
+    p1_cells = bytearray(np.asarray(p1_bs.get_board(), dtype=np.uint8).tobytes())
+    p1_board = np.frombuffer(p1_cells, dtype=np.uint8).reshape(height, width)
     p1_strat = ST1(height, width, ships_dict)
-    p1_instances = get_ship_instances(p1_board)
+    p1_instances, p1_owner = get_ship_instances(p1_board)
+    p1_ships_afloat = len(p1_instances)
     
     # Initialize Player 2:
     p2_bs = BS2(height, width, ships_dict)
     p2_bs.place_ships()
-    p2_board = p2_bs.get_board()
+    # Flat board (index y*width + x) for the game loop plus a 2D view of it for drawing
+    p2_cells = bytearray(np.asarray(p2_bs.get_board(), dtype=np.uint8).tobytes())
+    p2_board = np.frombuffer(p2_cells, dtype=np.uint8).reshape(height, width)
     p2_strat = ST2(height, width, ships_dict)
-    p2_instances = get_ship_instances(p2_board)
+    p2_instances, p2_owner = get_ship_instances(p2_board)
+    p2_ships_afloat = len(p2_instances)
     
     moves = 0
     current_player = starting_player
 
-    # Create logs directory if it doesn't exist
-    log_dir = f"./logs/battle_log_{int(time.time())}"
-    os.makedirs(log_dir, exist_ok=True)
+    log_file_path = None
+    player1_moves_log = player2_moves_log = None
+    if log_root is not None and not render_every:
+        # Log only: a single file next to the other battles, no directory per battle
+        log_file_path = log_root + ".txt"
+    elif log_root is not None:
+        # Create logs directory if it doesn't exist
+        os.makedirs(log_root, exist_ok=True)
+        log_file_path = os.path.join(log_root, "battle_log.txt")
+        player1_moves_log = os.path.join(log_root, "Player1")
+        player2_moves_log = os.path.join(log_root, "Player2")
+        os.makedirs(player1_moves_log, exist_ok=True)
+        os.makedirs(player2_moves_log, exist_ok=True)
 
-    player1_moves_log = log_dir + "/Player1/"
-    player2_moves_log = log_dir + "/Player2/"
-    os.makedirs(player1_moves_log, exist_ok=True)
-    os.makedirs(player2_moves_log, exist_ok=True)
+    # Initialize logging
+    # One handle per battle with a 64 KiB buffer: a battle's log is flushed in a few writes, not one per move.
+    # Without a log file log_fh is None and no move lines are formatted at all.
+    log_context = open(log_file_path, 'w', buffering=1 << 16) if log_file_path else contextlib.nullcontext()
+    with log_context as log_fh:
+        if log_fh is not None:
+            log_fh.write(f"New battle started: {width}x{height}, ships: {ship_counts}\n P1_board:{p1_instances} \n P2_board:{p2_instances}\n")
 
+        # Show initial boards
+        if render_every:
+            draw_board(p1_board, "Player 1 Board", _snapshot_path(player1_moves_log, "player1_initial.png"))
+            draw_board(p2_board, "Player 2 Board", _snapshot_path(player2_moves_log, "player2_initial.png"))
+            plt.pause(0.1)  # Allow time for initial windows to appear
 
-    # Initialize logging
-    log_file_path = os.path.join(log_dir, f"battle_log.txt")
-    with open(log_file_path, 'w') as f:
-        f.write(f"New battle started: {width}x{height}, ships: {ship_counts}\n P1_board:{p1_instances} \n P2_board:{p2_instances}")
-
-    # Show initial boards
-    draw_board(p1_board, "Player 1 Board", os.path.join(player1_moves_log, "player1_initial.png"))
-    draw_board(p2_board, "Player 2 Board", os.path.join(player2_moves_log, "player2_initial.png"))
-    plt.pause(0.1)  # Allow time for initial windows to appear
-
-    while moves < max_moves:
-        moves += 1
-        if current_player == 1:
-            x, y = p1_strat.get_next_attack()
-            hit, sunk = process_attack(x, y, p2_instances)
-            p1_strat.register_attack(x, y, is_hit=hit, is_sunk=sunk)
-            log_move(log_file_path, moves, 1, x, y, hit, sunk)
-            if verbose:
-                print(f"Move {moves}: Player 1 attacks ({x},{y}) -> {'Hit' if hit else 'Miss'}{' and Sunk' if sunk else ''}")
-            # Update visualization
-            p2_board[y][x] = 8 if hit else 9  # Mark hit/miss
-            draw_board(p2_board, "Player 2 Board", os.path.join(player2_moves_log, f"player2_move_{moves}.png"))
-            plt.pause(0.01)  # Allow time for update
-            if all(ship["hits"] == ship["coords"] for ship in p2_instances):
+        while moves < max_moves:
+            moves += 1
+            # Players alternate, so count each player's own moves for rendering
+            render_now = render_every and (moves + 1) // 2 % render_every == 0
+            if current_player == 1:
+                x, y = p1_strat.get_next_attack()
+                cell = _cell_index(x, y, width, height)
+                hit, sunk = process_attack(cell, p2_instances, p2_owner)
+                p1_strat.register_attack(x, y, is_hit=hit, is_sunk=sunk)
+                if log_fh is not None:
+                    log_move(log_fh, moves, 1, x, y, hit, sunk)
                 if verbose:
-                    print(f"Player 1 wins after {moves} moves!")
-                return 1, moves
-            current_player = 2
-        else:
-            x, y = p2_strat.get_next_attack()
-            hit, sunk = process_attack(x, y, p1_instances)
-            p2_strat.register_attack(x, y, is_hit=hit, is_sunk=sunk)
-            log_move(log_file_path, moves, 2, x, y, hit, sunk)
-            if verbose:
-                print(f"Move {moves}: Player 2 attacks ({x},{y}) -> {'Hit' if hit else 'Miss'}{' and Sunk' if sunk else ''}")
-            # Update visualization
-            p1_board[y][x] = 8 if hit else 9  # Mark hit/miss
-            draw_board(p1_board, "Player 1 Board", os.path.join(player1_moves_log, f"player1_move_{moves}.png"))
-            plt.pause(0.01)  # Allow time for update
-            if all(ship["hits"] == ship["coords"] for ship in p1_instances):
+                    print(f"Move {moves}: Player 1 attacks ({x},{y}) -> {'Hit' if hit else 'Miss'}{' and Sunk' if sunk else ''}")
+                p2_cells[cell] = 8 if hit else 9  # Mark hit/miss
+                if sunk:
+                    p2_ships_afloat -= 1
+                # Update visualization
+                if render_now or (render_every and p2_ships_afloat == 0):
+                    draw_board(p2_board, "Player 2 Board", _snapshot_path(player2_moves_log, f"player2_move_{moves}.png"))
+                if p2_ships_afloat == 0:
+                    if verbose:
+                        print(f"Player 1 wins after {moves} moves!")
+                    return 1, moves
+                current_player = 2
+            else:
+                x, y = p2_strat.get_next_attack()
+                cell = _cell_index(x, y, width, height)
+                hit, sunk = process_attack(cell, p1_instances, p1_owner)
+                p2_strat.register_attack(x, y, is_hit=hit, is_sunk=sunk)
+                if log_fh is not None:
+                    log_move(log_fh, moves, 2, x, y, hit, sunk)
                 if verbose:
-                    print(f"Player 2 wins after {moves} moves!")
-                return 2, moves
-            current_player = 1
+                    print(f"Move {moves}: Player 2 attacks ({x},{y}) -> {'Hit' if hit else 'Miss'}{' and Sunk' if sunk else ''}")
+                p1_cells[cell] = 8 if hit else 9  # Mark hit/miss
+                if sunk:
+                    p1_ships_afloat -= 1
+                # Update visualization
+                if render_now or (render_every and p1_ships_afloat == 0):
+                    draw_board(p1_board, "Player 1 Board", _snapshot_path(player1_moves_log, f"player1_move_{moves}.png"))
+                if p1_ships_afloat == 0:
+                    if verbose:
+                        print(f"Player 2 wins after {moves} moves!")
+                    return 2, moves
+                current_player = 1
 
     # If we exceeded max_moves, consider it a draw.
     if verbose:
         print(f"Battle ended in a draw after {moves} moves.")
     return 0, moves
 
+def _battle_worker(job: tuple[int, int, int, list[int], int]) -> tuple[int, int, int]:
+    """
+    Runs one battle without drawing or log files in a worker process.
+    job is (battle_num, width, height, ship_counts, starting_player);
+    returns (battle_num, winner, moves).
+    """
+    battle_num, width, height, ship_counts, starting_player = job
+    winner, moves = simulate_battle(False, width, height, ship_counts, starting_player)
+    return battle_num, winner, moves
+
 def _print_ship_positions(ship_instances: list[dict]):
     """Print positions of all ships"""
     for ship in ship_instances:
@@ -293,7 +371,13 @@ def main():
     parser.add_argument("-H", "--height", type=int, default=10, help="Board height (default=10)")
     parser.add_argument("-l", "--list", type=str, default=None,
                         help="Comma-separated ship counts for IDs 1..7 (if specified, turns off random ship generation)")
+    parser.add_argument("-r", "--render-every", type=int, default=1,
+                        help="Redraw each board every N moves of its attacker (0 disables the gui, default=1)")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="Worker processes; more than 1 runs battles in parallel without gui or logs (0 = all cores, default=1)")
     args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("-j/--jobs must be 0 (one per CPU core) or a positive number of processes")
 
     verbose = args.verbose
     battle_count = args.count
@@ -316,17 +400,39 @@ def main():
     wins = {1: 0, 2: 0, 0: 0}  # 0 indicates a draw.
     total_moves = 0
 
-    for battle_num in range(1, battle_count+1):
-        # Alternate starting player: if battle number is odd, Player 1 starts; if even, Player 2 starts.
-        starting_player = 1 if (battle_num % 2 == 1) else 2
-        if verbose:
-            print(f"\n=== Battle {battle_num} (Player {starting_player} starts) ===")
-        winner, moves = simulate_battle(verbose, width, height, ship_counts, starting_player)
-        wins[winner] += 1
-        total_moves += moves
-        if verbose:
-            outcome = "Draw" if winner == 0 else f"Winner: Player {winner}"
-            print(f"Battle {battle_num} finished: {outcome} in {moves} moves.")
+    if args.jobs == 1:
+        # All battles of this run log into one directory: battle_<n>.txt, or a battle_<n>/
+        # subdirectory with the snapshots when rendering
+        run_dir = os.path.join("logs", f"run_{int(time.time())}")
+        os.makedirs(run_dir, exist_ok=True)
+        for battle_num in range(1, battle_count+1):
+            # Alternate starting player: if battle number is odd, Player 1 starts; if even, Player 2 starts.
+            starting_player = 1 if (battle_num % 2 == 1) else 2
+            if verbose:
+                print(f"\n=== Battle {battle_num} (Player {starting_player} starts) ===")
+            winner, moves = simulate_battle(verbose, width, height, ship_counts, starting_player, args.render_every,
+                                            os.path.join(run_dir, f"battle_{battle_num}"))
+            wins[winner] += 1
+            total_moves += moves
+            if verbose:
+                outcome = "Draw" if winner == 0 else f"Winner: Player {winner}"
+                print(f"Battle {battle_num} finished: {outcome} in {moves} moves.")
+    else:
+        jobs = [(battle_num, width, height, ship_counts, 1 if (battle_num % 2 == 1) else 2)
+                for battle_num in range(1, battle_count+1)]
+        processes = args.jobs if args.jobs > 0 else os.cpu_count()
+        chunksize = max(1, battle_count // (processes * 4))
+        # Forked workers would inherit the GUI backend state on macOS/Windows, so spawn there.
+        ctx = mp.get_context("fork" if sys.platform.startswith("linux") else "spawn")
+        # Forked workers inherit NumPy's global RNG state; reseed each from OS entropy so
+        # bots using np.random do not generate the same boards in every worker
+        with ctx.Pool(processes, initializer=np.random.seed) as pool:
+            for battle_num, winner, moves in pool.imap_unordered(_battle_worker, jobs, chunksize):
+                wins[winner] += 1
+                total_moves += moves
+                if verbose:
+                    outcome = "Draw" if winner == 0 else f"Winner: Player {winner}"
+                    print(f"Battle {battle_num} finished: {outcome} in {moves} moves.")
 
     avg_moves = total_moves / battle_count if battle_count else 0
     print("\n=== Overall Battle Results ===")
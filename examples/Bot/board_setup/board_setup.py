@@ -7,46 +7,143 @@ This module contains the BoardSetup class responsible for:
  - Providing board statistics and individual tile lookups
 """
 
-import random
+from types import MappingProxyType
 
+import numpy as np
 
-def _generate_shape(spec: dict) -> list:
-    """Generates a ship shape based on the specification"""
-    shape_type = random.choice(spec['shapes'])
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:  # numba is optional; without it placement uses a plain-Python search
+    _HAVE_NUMBA = False
+
+
+# How many times place_ships() resets the board and starts over before giving up
+MAX_PLACEMENT_ATTEMPTS = 64
+
+
+def _base_shapes(spec: dict) -> list:
+    """Returns every unrotated variant of the ship shapes in the specification"""
     size = spec['size']
+    shapes = []
+    for shape_type in spec['shapes']:
+        if shape_type == 'I':
+            shapes.append([(i, 0) for i in range(size)])
+        elif shape_type == 'L':
+            shapes.extend([
+                # Vertical leg + horizontal base
+                [(0, 0), (0, 1), (0, 2), (1, 2)],  # classic L shape
+                [(0, 0), (1, 0), (2, 0), (2, 1)],  # rotated L shape
+                # Horizontal base + vertical leg
+                [(0, 0), (1, 0), (2, 0), (0, 1)],  # mirrored L shape
+                [(0, 0), (0, 1), (1, 1), (2, 1)]   # inverted L shape
+            ])
+        elif shape_type == 'T':
+            shapes.append([(i, 0) for i in range(3)] + [(1, 1)])
+        elif shape_type == 'Z':
+            shapes.extend([
+                [(0,0), (1,0), (1,1), (2,1)],
+                [(0,1), (1,1), (1,0), (2,0)]
+            ])
+        elif shape_type == 'TT':
+            # Correct TT shape:
+            #  **
+            # ****
+            shapes.append([(1,0), (2,0),  # Top row
+                           (0,1), (1,1), (2,1), (3,1)])  # Bottom row
+    return shapes
+
+
+def _shape_variants(spec: dict) -> tuple:
+    """
+    Returns all distinct placements of a ship relative to its anchor cell:
+    every base shape in every rotation, normalized so the smallest offsets are 0.
+    """
+    variants = []
+    for shape in _base_shapes(spec):
+        for degrees in (0, 90, 180, 270):
+            cells = _rotate_shape(shape, degrees, 0, 0)
+            min_x = min(dx for dx, dy in cells)
+            min_y = min(dy for dx, dy in cells)
+            offsets = tuple(sorted((dx - min_x, dy - min_y) for dx, dy in cells))
+            if offsets not in variants:
+                variants.append(offsets)
+    return tuple(variants)
 
-    # Generate different shapes based on type
-    if shape_type == 'I':
-        return [(i, 0) for i in range(size)]
-    elif shape_type == 'L':
-        return [(0, i) for i in range(size)] + [(1, size-1)]
-    elif shape_type == 'T':
-        return [(i, 0) for i in range(3)] + [(1, 1)]
-    elif shape_type == 'Z':
-        return random.choice([
-            [(0,0), (1,0), (1,1), (2,1)],
-            [(0,1), (1,1), (1,0), (2,0)]
-        ])
-    elif shape_type == 'TT':
-        # Correct TT shape:
-        #  **
-        # ****
-        return [(1,0), (2,0),  # Top row
-                (0,1), (1,1), (2,1), (3,1)]  # Bottom row
-    return []
-
-
-def _generate_l_shape() -> list:
-    """Generates different variations of L-shaped ships with explicit coordinates"""
-    variants = [
-        # Vertical leg + horizontal base
-        [(0, 0), (0, 1), (0, 2), (1, 2)],  # classic L shape
-        [(0, 0), (1, 0), (2, 0), (2, 1)],  # rotated L shape
-        # Horizontal base + vertical leg
-        [(0, 0), (1, 0), (2, 0), (0, 1)],  # mirrored L shape
-        [(0, 0), (0, 1), (1, 1), (2, 1)]   # inverted L shape
-    ]
-    return random.choice(variants)
+
+def _variant_arrays(variants: list) -> tuple:
+    """
+    Packs the normalized shape variants of one ship type into arrays for _place_first_fit:
+    - offsets (variants, size, 2): the (dx, dy) of every ship cell
+    - halos   (variants, n, 2): the ship cells and their direct neighbours, shifted by +1
+              so that they index the padded board directly
+    - extents (variants, 2): the (width, height) of every variant
+    """
+    halos = []
+    for offsets in variants:
+        halos.append(sorted({(dx + 1 + nx, dy + 1 + ny)
+                             for dx, dy in offsets
+                             for nx, ny in [(0,0), (-1,0), (1,0), (0,-1), (0,1)]}))
+    # Rotations and reflections of one shape share the same halo size
+    halo_size = max((len(halo) for halo in halos), default=0)
+    halos = [halo + halo[:1] * (halo_size - len(halo)) for halo in halos]
+    extents = [(max(dx for dx, dy in offsets) + 1, max(dy for dx, dy in offsets) + 1) for offsets in variants]
+    return (np.array(variants, dtype=np.int64).reshape(len(variants), -1, 2),
+            np.array(halos, dtype=np.int64).reshape(len(variants), halo_size, 2),
+            np.array(extents, dtype=np.int64).reshape(len(variants), 2))
+
+
+if _HAVE_NUMBA:
+    @njit
+    def _valid(padded, x, y, halo, width, height):
+        """Boundary, collision and adjacency check of one variant anchored at (x, y)"""
+        if x < 0 or y < 0 or x + width > padded.shape[1] - 2 or y + height > padded.shape[0] - 2:
+            return False
+        for h in range(halo.shape[0]):
+            if padded[y + halo[h, 1], x + halo[h, 0]] != 0:
+                return False
+        return True
+
+    @njit
+    def _place_first_fit(padded, starts, offsets, halos, extents, order, ship_id):
+        """
+        Writes ship_id into the padded board at the first valid (start cell, variant)
+        pair, trying the variants in the given order. starts holds flat cell indices
+        y*cols + x. Returns False if none fits.
+        """
+        cols = padded.shape[1] - 2
+        for p in range(starts.shape[0]):
+            x = starts[p] % cols
+            y = starts[p] // cols
+            for v in order:
+                if _valid(padded, x, y, halos[v], extents[v, 0], extents[v, 1]):
+                    for c in range(offsets.shape[1]):
+                        padded[y + 1 + offsets[v, c, 1], x + 1 + offsets[v, c, 0]] = ship_id
+                    return True
+        return False
+else:
+    def _place_first_fit(padded, starts, offsets, halos, extents, order, ship_id):
+        """
+        Plain-Python stand-in for the kernel above: the same first-fit search, run over
+        nested lists of ints, since indexing NumPy arrays element by element from Python is slow
+        """
+        rows, cols = padded.shape[0] - 2, padded.shape[1] - 2
+        grid = padded.tolist()
+        variants = [(halos[v].tolist(), offsets[v].tolist(), int(extents[v, 0]), int(extents[v, 1]))
+                    for v in order.tolist()]
+        for start in starts.tolist():
+            y, x = divmod(start, cols)
+            for halo, cells, width, height in variants:
+                if x + width > cols or y + height > rows:
+                    continue
+                for hx, hy in halo:
+                    if grid[y + hy][x + hx]:
+                        break
+                else:
+                    for dx, dy in cells:
+                        padded[y + 1 + dy, x + 1 + dx] = ship_id
+                    return True
+        return False
 
 
 def _rotate_shape(shape: list, degrees: int, x: int, y: int) -> list:
@@ -63,6 +160,27 @@ def _rotate_shape(shape: list, degrees: int, x: int, y: int) -> list:
     return rotated
 
 
+# Ship specifications including size and possible shapes. Read-only at every level:
+# the shape variants below are prebuilt from them and would not follow edits
+SHIP_SPECS = MappingProxyType({
+    ship_id: MappingProxyType(spec) for ship_id, spec in {
+        1: {'size': 2, 'shapes': ('I',)},  # Smallest ship
+        2: {'size': 3, 'shapes': ('I',)},  # Medium ship
+        3: {'size': 4, 'shapes': ('I',)},  # Large ship
+        4: {'size': 4, 'shapes': ('T',)},  # T-shaped ship
+        5: {'size': 4, 'shapes': ('L',)},  # L-shaped ship
+        6: {'size': 4, 'shapes': ('Z',)},  # Z-shaped ship
+        7: {'size': 6, 'shapes': ('TT',)}  # Special TT-shaped ship
+    }.items()
+})
+
+# Every rotated shape variant per ship type as normalized (dx, dy) offsets, built once at import
+SHIP_VARIANTS = {ship_id: _shape_variants(spec) for ship_id, spec in SHIP_SPECS.items()}
+
+# The same variants packed into (offsets, halos, extents) arrays for _place_first_fit
+_VARIANT_ARRAYS = {ship_id: _variant_arrays(variants) for ship_id, variants in SHIP_VARIANTS.items()}
+
+
 class BoardSetup:
     def __init__(self, rows: int, cols: int, ships_dict: dict[int, int]):
         """
@@ -78,27 +196,24 @@ class BoardSetup:
         self.cols = cols
         self.ships_dict = ships_dict
         
-        # Initialize empty board (0 = water, 1-7 = ship IDs)
-        self.board = [[0 for _ in range(cols)] for _ in range(rows)]
+        # Initialize empty board (0 = water, 1-7 = ship IDs). The board is a view
+        # into a copy padded with one row/column of water on every side, so
+        # neighbour checks never need bounds tests.
+        self._padded = np.zeros((rows + 2, cols + 2), dtype=np.uint8)
+        self.board = self._padded[1:-1, 1:-1]
         
-        # Define ship specifications including size and possible shapes
-        self.ship_specs = {
-            1: {'size': 2, 'shapes': ['I']},  # Smallest ship
-            2: {'size': 3, 'shapes': ['I']},  # Medium ship
-            3: {'size': 4, 'shapes': ['I']},  # Large ship
-            4: {'size': 4, 'shapes': ['T']},  # T-shaped ship
-            5: {'size': 4, 'shapes': ['L']},  # L-shaped ship
-            6: {'size': 4, 'shapes': ['Z']},  # Z-shaped ship
-            7: {'size': 6, 'shapes': ['TT']}  # Special TT-shaped ship
-        }
+        # Ship specifications including size and possible shapes (read-only, see SHIP_SPECS)
+        self.ship_specs = SHIP_SPECS
         self.placement_attempts = 0
+        self._rng = np.random.default_rng()
 
-    def get_board(self) -> list[list[int]]:
+    def get_board(self) -> np.ndarray:
         """
-        Returns the current 2D board state.
+        Returns a copy of the current 2D board state as a (rows, cols) uint8 array.
         0 = water, 1..7 = specific ship ID.
+        Indexes like the list-of-lists board (board[y][x]); use .tolist() if plain lists are needed.
         """
-        return [row.copy() for row in self.board]
+        return self.board.copy()
 
     def get_tile(self, x: int, y: int) -> int:
         """
@@ -110,92 +225,64 @@ class BoardSetup:
         """
         if not (0 <= x < self.cols and 0 <= y < self.rows):
             raise IndexError("Coordinates out of bounds")
-        return self.board[y][x]
+        return int(self.board[y, x])
 
-    def place_ships(self) -> list[list[int]]:
+    def place_ships(self) -> np.ndarray:
         """
         Places ships on the board using a sophisticated algorithm:
         1. Sorts ships by size (largest first)
         2. Checks if there's enough space
         3. Attempts to place each ship
-        4. If placement fails, resets and retries
+        4. If placement fails, resets and retries (at most MAX_PLACEMENT_ATTEMPTS times)
         Implements intelligent ship placement with collision avoidance.
+
+        Raises a ValueError if the ships cannot fit by area and a RuntimeError if
+        no attempt manages to place them all.
         """
-        ship_ids = sorted(self.ships_dict.keys(), key=lambda x: self.ship_specs[x]['size'], reverse=True)
-        
         # Check if there is enough space for all ships
         total_required = sum(self.ship_specs[ship_id]['size'] * count for ship_id, count in self.ships_dict.items())
         if total_required > self.rows * self.cols:
             raise ValueError("Not enough space to place all ships")
-        
-        # Start placement from different positions
-        start_positions = [(x, y) for x in range(self.cols) for y in range(self.rows)]
-        random.shuffle(start_positions)
-        
+
+        for _ in range(MAX_PLACEMENT_ATTEMPTS):
+            self.placement_attempts += 1
+            self.reset_board()
+            if self._try_place_all():
+                return self.board
+        raise RuntimeError(f"Could not place ships after {MAX_PLACEMENT_ATTEMPTS} attempts")
+
+    def _try_place_all(self) -> bool:
+        """
+        Makes one placement attempt on the current board: every ship, largest first,
+        from a freshly shuffled set of start positions. Returns False as soon as a
+        ship does not fit.
+        """
+        ship_ids = sorted(self.ships_dict.keys(), key=lambda x: self.ship_specs[x]['size'], reverse=True)
+
+        # Start placement from different positions (flat cell indices y*cols + x)
+        start_positions = np.arange(self.rows * self.cols, dtype=np.int64)
+        self._rng.shuffle(start_positions)
+
         for ship_id in ship_ids:
             count = self.ships_dict[ship_id]
             for _ in range(count):
                 if not self._try_place_ship(ship_id, start_positions):
-                    # Reset board and try again if placement fails
-                    self.reset_board()
-                    return self.place_ships()
-        return self.board
-
-    def _try_place_ship(self, ship_id: int, start_positions: list) -> bool:
-        """Improved placement with better position selection"""
-        spec = self.ship_specs[ship_id]
-        max_attempts = 6900  # Increased number of attempts
-        
-        # Special handling for L-shaped ships
-        if ship_id == 5:
-            shape = _generate_l_shape()
-        else:
-            shape = _generate_shape(spec)
-            
-        if not shape:
-            return False
-            
-        # Try positions in shuffled order
-        for x, y in start_positions:
-                for orientation in [0, 90, 180, 270]:
-                    cells = _rotate_shape(shape, orientation, x, y)
-                    if cells and self._is_valid_placement(cells):
-                        # Place the ship if valid position found
-                        for cx, cy in cells:
-                            self.board[cy][cx] = ship_id
-                        return True
-        return False
-
-    def _is_valid_placement(self, cells: list) -> bool:
-        """
-        Validates ship placement by checking:
-        1. Boundary conditions
-        2. Collision with existing ships
-        3. Adjacency to other ships
-        Ensures proper spacing and valid ship positions.
-        """
-        for x, y in cells:
-            # Boundary check
-            if x < 0 or x >= self.cols or y < 0 or y >= self.rows:
-                return False
-            # Collision check
-            if self.board[y][x] != 0:
-                return False
-            
-            # Adjacency check (only direct neighbors)
-            for dx, dy in [(-1,0), (1,0), (0,-1), (0,1)]:
-                nx = x + dx
-                ny = y + dy
-                if 0 <= nx < self.cols and 0 <= ny < self.rows:
-                    if self.board[ny][nx] != 0:
-                        return False
+                    return False
         return True
 
+    def _try_place_ship(self, ship_id: int, start_positions: np.ndarray) -> bool:
+        """Places the ship at the first valid (position, variant) pair, trying variants in random order"""
+        offsets, halos, extents = _VARIANT_ARRAYS[ship_id]
+        if not len(offsets):
+            return False
+        order = self._rng.permutation(len(offsets))
+        return _place_first_fit(self._padded, start_positions, offsets, halos, extents, order, ship_id)
+
     def reset_board(self) -> None:
         """
         Resets the board back to all 0 (water).
         """
-        self.board = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
+        self._padded.fill(0)
 
     def board_stats(self) -> dict:
         """
@@ -205,7 +292,7 @@ class BoardSetup:
         dict: Contains counts of empty and occupied spaces
         """
         # Count occupied spaces (non-zero values)
-        occupied = sum(cell != 0 for row in self.board for cell in row)
+        occupied = int(np.count_nonzero(self.board))
         return {
             "empty_spaces": self.rows * self.cols - occupied,
             "occupied_spaces": occupied
@@ -8,6 +8,192 @@ This module contains the Strategy class responsible for:
  - Keeping track of remaining enemy ships in a ships_dict.
 """
 
+
+import numpy as np
+
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:  # numba is optional; without it the kernels run as plain Python
+    _HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# Enemy board cell states
+UNK, HIT, MISS = 0, 1, 2
+# Symbols reported by get_enemy_board(), indexed by cell state
+_SYMBOLS = np.array(['?', 'H', 'M'])
+
+# Neighbour offsets (dx, dy): orthogonal, and orthogonal plus diagonal
+_N4 = ((-1, 0), (1, 0), (0, -1), (0, 1))
+_N8 = _N4 + ((-1, -1), (1, -1), (-1, 1), (1, 1))
+_N4_OFFSETS = np.array(_N4, dtype=np.int64)
+_N8_OFFSETS = np.array(_N8, dtype=np.int64)
+
+# Unrotated ship outlines recognized by analyze_ship_shape, as (x, y) cells
+_SHAPE_OUTLINES = {
+    "I": [[(i, 0) for i in range(size)] for size in (2, 3, 4)],
+    "L": [[(0, 0), (1, 0), (0, 1)],            # 3 cells
+          [(0, 0), (0, 1), (0, 2), (1, 2)]],   # 4 cells
+    "T": [[(0, 0), (1, 0), (2, 0), (1, 1)]],
+    "Z": [[(0, 0), (1, 0), (1, 1), (2, 1)]],
+    "TT": [[(1, 0), (2, 0), (0, 1), (1, 1), (2, 1), (3, 1)]],
+}
+
+
+# Ship outline per ship ID, matching the shapes BoardSetup places
+_SHIP_OUTLINES = {
+    1: [(0, 0), (1, 0)],
+    2: [(0, 0), (1, 0), (2, 0)],
+    3: [(0, 0), (1, 0), (2, 0), (3, 0)],
+    4: [(0, 0), (1, 0), (2, 0), (1, 1)],
+    5: [(0, 0), (0, 1), (0, 2), (1, 2)],
+    6: [(0, 0), (1, 0), (1, 1), (2, 1)],
+    7: [(1, 0), (2, 0), (0, 1), (1, 1), (2, 1), (3, 1)],
+}
+
+# Side of the square window that every ship orientation fits in
+_FOOTPRINT_SIZE = 4
+
+# dtype of the heatmap and every array feeding it. float32 holds the whole placement
+# counts exactly (below 2**24) at half the size of float64, and keeps the products on BLAS;
+# uint16 would overflow once placements covering hits are boosted by OPEN_HIT_WEIGHT
+HEAT_DTYPE = np.float32
+
+# Placements covering k unsunk hits count 1 + k * OPEN_HIT_WEIGHT times,
+# so cells that can finish off a hit ship outrank the open-water search
+OPEN_HIT_WEIGHT = 1000
+
+
+def _normalize(cells) -> frozenset:
+    """Shifts the cells so the smallest x and y are 0"""
+    min_x = min(x for x, y in cells)
+    min_y = min(y for x, y in cells)
+    return frozenset((x - min_x, y - min_y) for x, y in cells)
+
+
+def _orientations(outline: list) -> list:
+    """Returns every distinct rotation and reflection of the outline as normalized cell sets"""
+    result = []
+    for cells in (outline, [(-x, y) for x, y in outline]):
+        for _ in range(4):
+            cells = [(-y, x) for x, y in cells]  # rotate by 90 degrees
+            norm = _normalize(cells)
+            if norm not in result:
+                result.append(norm)
+    return result
+
+
+def _build_shape_table() -> dict:
+    """Maps (size, width, height) to the (cells, shape name) of every orientation of the outlines above"""
+    table = {}
+    for shape_name, outlines in _SHAPE_OUTLINES.items():
+        for outline in outlines:
+            for norm in _orientations(outline):
+                key = (len(norm), max(x for x, y in norm) + 1, max(y for x, y in norm) + 1)
+                table.setdefault(key, []).append((norm, shape_name))
+    return table
+
+
+def _build_footprints() -> tuple:
+    """
+    Returns (ship IDs, footprints) with one entry per orientation of every ship:
+    footprints[i] is the flattened _FOOTPRINT_SIZE x _FOOTPRINT_SIZE window the orientation
+    covers when anchored at the window's top-left cell
+    """
+    ship_ids, footprints = [], []
+    for ship_id, outline in _SHIP_OUTLINES.items():
+        for norm in _orientations(outline):
+            window = np.zeros((_FOOTPRINT_SIZE, _FOOTPRINT_SIZE), dtype=HEAT_DTYPE)
+            for x, y in norm:
+                window[y, x] = 1.0
+            ship_ids.append(ship_id)
+            footprints.append(window.ravel())
+    return np.array(ship_ids), np.array(footprints)
+
+
+# Built once at import: analyze_ship_shape only compares against the entries under its key
+_SHAPE_TABLE = _build_shape_table()
+
+# Ship ID of a sunk ship, looked up by its normalized cells
+_SHIP_BY_CELLS = {norm: ship_id for ship_id, outline in _SHIP_OUTLINES.items()
+                  for norm in _orientations(outline)}
+
+# Every ship orientation as a footprint row, for the placement heatmap
+_FOOTPRINT_SHIPS, _FOOTPRINTS = _build_footprints()
+
+
+if _HAVE_NUMBA:
+    @njit
+    def _pick_cell(prob, mask, checker):
+        """
+        Returns (x, y) of the unattacked cell with the highest probability, or (-1, -1)
+        when every cell is attacked. Ties go to checker cells, then to row-major order.
+        The heatmap holds whole placement counts, so the composite score 2 * prob + checker
+        orders cells exactly like (prob, checker) and needs a single comparison per cell.
+        """
+        best = -1.0
+        bx, by = -1, -1
+        for y in range(prob.shape[0]):
+            for x in range(prob.shape[1]):
+                if mask[y, x]:
+                    continue
+                score = 2.0 * float(prob[y, x]) + checker[y, x]
+                if score > best:
+                    best = score
+                    bx, by = x, y
+        return bx, by
+else:
+    def _pick_cell(prob, mask, checker):
+        """Vectorized stand-in for the kernel above: same scores, first maximum in row-major order"""
+        idx = int(np.where(mask, -1.0, 2.0 * prob.astype(np.float64) + checker).argmax())
+        if mask.flat[idx]:
+            return -1, -1
+        y, x = divmod(idx, prob.shape[1])
+        return x, y
+
+
+@njit
+def _bfs_ship(board, x0, y0, seen, gen, queue, offsets):
+    """
+    Flood-fills the HIT cells connected to (x0, y0) through the (dx, dy) neighbour offsets.
+    A cell counts as visited once seen[y, x] == gen, so seen never needs clearing
+    as long as every call gets a new gen. The ship cells are left in queue[:count] as (x, y) rows.
+    Returns (count, min_x, max_x, min_y, max_y); count is 0 if (x0, y0) is not a hit.
+    """
+    rows, cols = board.shape
+    if board[y0, x0] != HIT:
+        return 0, x0, x0, y0, y0
+
+    seen[y0, x0] = gen
+    queue[0, 0] = x0
+    queue[0, 1] = y0
+    head, tail = 0, 1
+    min_x, max_x = x0, x0
+    min_y, max_y = y0, y0
+    while head < tail:
+        cx = queue[head, 0]
+        cy = queue[head, 1]
+        head += 1
+        min_x = min(min_x, cx)
+        max_x = max(max_x, cx)
+        min_y = min(min_y, cy)
+        max_y = max(max_y, cy)
+        for i in range(offsets.shape[0]):
+            nx = cx + offsets[i, 0]
+            ny = cy + offsets[i, 1]
+            if 0 <= nx < cols and 0 <= ny < rows and seen[ny, nx] != gen and board[ny, nx] == HIT:
+                seen[ny, nx] = gen
+                queue[tail, 0] = nx
+                queue[tail, 1] = ny
+                tail += 1
+    return tail, min_x, max_x, min_y, max_y
+
+
 class GameOver(Exception):
     """Custom exception for game over"""
     pass
@@ -28,15 +214,38 @@ class Strategy:
         
         # Initialize tracking variables
         self.ships_dict = ships_dict.copy()
-        self.attacked = set()
-        self.enemy_board = [['?' for _ in range(cols)] for _ in range(rows)]
-        self.probability_map = [[1.0 for _ in range(cols)] for _ in range(rows)]
+        self.enemy_board = np.full((rows, cols), UNK, dtype=np.uint8)
+        # Number of (weighted) ship placements covering each cell, rebuilt by _update_heatmap
+        self.probability_map = np.ones((rows, cols), dtype=HEAT_DTYPE)
+        self.attacked_mask = np.zeros((rows, cols), dtype=bool)
+        # Cells with odd x+y win ties (checkerboard pattern)
+        self.checker = (np.add.outer(np.arange(rows), np.arange(cols)) & 1).astype(np.uint8)
+        
+        # Cells no ship can still cover (misses, sunk ships and their neighbours) and hits
+        # of ships not sunk yet. Both are views into grids padded on the right and bottom
+        # so that every footprint window anchored on the board stays in bounds; the padding
+        # is blocked, which rules out placements that stick out of the board.
+        pad = _FOOTPRINT_SIZE - 1
+        self._blocked_padded = np.ones((rows + pad, cols + pad), dtype=HEAT_DTYPE)
+        self._blocked_padded[:rows, :cols] = 0.0
+        self._blocked = self._blocked_padded[:rows, :cols]
+        self._open_hits_padded = np.zeros((rows + pad, cols + pad), dtype=HEAT_DTYPE)
+        self._open_hits = self._open_hits_padded[:rows, :cols]
+        # Flood fill scratch shared by every _bfs_ship call, allocated once:
+        # cells with _bfs_gen == _gen_counter were visited by the current fill
+        self._bfs_gen = np.zeros((rows, cols), dtype=np.int32)
+        self._gen_counter = 0
+        self._bfs_queue = np.zeros((rows * cols, 2), dtype=np.int32)
         
         # Define ship metadata including size and shape
         self.ship_metadata = {
             1: 2, 2: 3, 3: 4, 4: 4, 5: 4, 6: 4, 7: 6  # ID: size
         }
         
+        # Hits needed to sink the whole fleet, and distinct cells hit so far
+        self._required_hits = sum(self.ship_metadata[ship_id] * count for ship_id, count in ships_dict.items())
+        self._hit_count = 0
+        
         # Copy of remaining ships for tracking purposes
         self.ships_remaining = ships_dict.copy()
 
@@ -54,26 +263,13 @@ class Strategy:
         """
         Determines the next attack position based on probability map.
         Prioritizes cells with the highest probability of containing a ship.
-        Uses checkerboard pattern for tie-breaking.
+        Uses checkerboard pattern for tie-breaking (odd x+y first, then row-major order).
         """
-        max_prob = -1
-        candidates = []
-        
-        # Find all cells with maximum probability
-        for y in range(self.rows):
-            for x in range(self.cols):
-                if (x, y) not in self.attacked:
-                    if self.probability_map[y][x] > max_prob:
-                        max_prob = self.probability_map[y][x]
-                        candidates = [(x, y)]
-                    elif self.probability_map[y][x] == max_prob:
-                        candidates.append((x, y))
-        
-        # Use checkerboard pattern for tie-breaking
-        if len(candidates) > 1:
-            candidates.sort(key=lambda pos: (pos[0] + pos[1]) % 2, reverse=True)
-        
-        return candidates[0] if candidates else self._fallback_attack()
+        self._update_heatmap()
+        x, y = _pick_cell(self.probability_map, self.attacked_mask, self.checker)
+        if x < 0:
+            return self._fallback_attack()
+        return int(x), int(y)
 
     def register_attack(self, x: int, y: int, is_hit: bool, is_sunk: bool):
         """
@@ -85,76 +281,92 @@ class Strategy:
         is_hit (bool): True if attack hit a ship
         is_sunk (bool): True if attack sunk a ship
         """
-        self.attacked.add((x, y))
-        self.enemy_board[y][x] = 'H' if is_hit else 'M'
+        self.attacked_mask[y, x] = True
+        if is_hit and self.enemy_board[y, x] != HIT:
+            self._hit_count += 1
+        self.enemy_board[y, x] = HIT if is_hit else MISS
         
         if is_hit:
-            self._update_probabilities_on_hit(x, y)
+            self._open_hits[y, x] = 1.0
             if is_sunk:
-                self._mark_sunk_ship_area(x, y)
-                self._update_ship_count(x, y)
-
-    def _update_probabilities_on_hit(self, x: int, y: int):
-        directions = [(-1,0), (1,0), (0,-1), (0,1)]
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < self.cols and 0 <= ny < self.rows:
-                if (nx, ny) not in self.attacked:
-                    self.probability_map[ny][nx] *= 2.0
-
-    def _mark_sunk_ship_area(self, x: int, y: int):
-        visited = set()
-        queue = [(x, y)]
-        ship_cells = []
-        
-        while queue:
-            cx, cy = queue.pop(0)
-            if (cx, cy) in visited:
-                continue
-            visited.add((cx, cy))
-            
-            if 0 <= cx < self.cols and 0 <= cy < self.rows:
-                if self.enemy_board[cy][cx] == 'H':
-                    ship_cells.append((cx, cy))
-                    for dx, dy in [(-1,0), (1,0), (0,-1), (0,1)]:
-                        nx, ny = cx + dx, cy + dy
-                        queue.append((nx, ny))
-        
-        if not ship_cells:
-            return
-        
-        # Calculate boundaries for marking surrounding area
-        min_x = max(0, min(cx for cx, cy in ship_cells) - 1)
-        max_x = min(self.cols-1, max(cx for cx, cy in ship_cells) + 1)
-        min_y = max(0, min(cy for cx, cy in ship_cells) - 1)
-        max_y = min(self.rows-1, max(cy for cx, cy in ship_cells) + 1)
-        
-        # Mark surrounding area as impossible positions
-        for y in range(min_y, max_y+1):
-            for x in range(min_x, max_x+1):
-                if (x, y) not in self.attacked:
-                    self.probability_map[y][x] = 0.0
+                # One flood fill serves both the area marking and the ship count
+                ship_cells = self._scan_sunk_ship(x, y)
+                if ship_cells:
+                    self._mark_sunk_ship_area(ship_cells)
+                    self._update_ship_count(ship_cells)
+        else:
+            self._blocked[y, x] = 1.0
+
+    def _update_heatmap(self):
+        """
+        Rebuilds probability_map as the number of ship placements covering each cell.
+        Every orientation of every remaining ship is tried at every anchor cell; a placement
+        is valid if it covers no blocked cell, and counts once per remaining ship of its type,
+        boosted by OPEN_HIT_WEIGHT for each unsunk hit it covers.
+        """
+        rows, cols, size = self.rows, self.cols, _FOOTPRINT_SIZE
+        windows = size * size
+        # (anchor cell, window cell) matrices of the blocked cells and open hits
+        blocked = np.lib.stride_tricks.sliding_window_view(
+            self._blocked_padded, (size, size)).reshape(rows * cols, windows)
+        open_hits = np.lib.stride_tricks.sliding_window_view(
+            self._open_hits_padded, (size, size)).reshape(rows * cols, windows)
+
+        # (anchor cell, orientation) placement weights
+        counts = np.array([self.ships_remaining.get(ship_id, 0) for ship_id in _FOOTPRINT_SHIPS],
+                          dtype=HEAT_DTYPE)
+        weights = np.where(blocked @ _FOOTPRINTS.T == 0, counts, HEAT_DTYPE(0))
+        weights *= 1.0 + OPEN_HIT_WEIGHT * (open_hits @ _FOOTPRINTS.T)
+
+        # Spread every placement's weight back over the cells it covers
+        coverage = (weights @ _FOOTPRINTS).reshape(rows, cols, size, size)
+        heat = np.zeros_like(self._blocked_padded)
+        for dy in range(size):
+            for dx in range(size):
+                heat[dy:dy+rows, dx:dx+cols] += coverage[:, :, dy, dx]
+        self.probability_map[:] = heat[:rows, :cols]
+
+    def _scan_sunk_ship(self, x: int, y: int) -> list[tuple[int, int]]:
+        """Returns the hit cells orthogonally connected to (x, y)"""
+        count = _bfs_ship(self.enemy_board, x, y, self._bfs_gen, self._next_bfs_gen(),
+                          self._bfs_queue, _N4_OFFSETS)[0]
+        return [(cx, cy) for cx, cy in self._bfs_queue[:count].tolist()]
+
+    def _next_bfs_gen(self) -> int:
+        """Starts a new flood fill generation, which invalidates all earlier visited marks"""
+        self._gen_counter += 1
+        return self._gen_counter
+
+    def _mark_sunk_ship_area(self, ship_cells: list[tuple[int, int]]):
+        """Blocks the sunk ship and its orthogonal neighbours, where no other ship may lie"""
+        for x, y in ship_cells:
+            self._open_hits[y, x] = 0.0
+            self._blocked[y, x] = 1.0
+            for dx, dy in _N4:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < self.cols and 0 <= ny < self.rows:
+                    self._blocked[ny, nx] = 1.0
+
+    @property
+    def attacked(self) -> set[tuple[int, int]]:
+        """Set of attacked (x, y) cells, read from attacked_mask"""
+        return {(x, y) for y, x in np.argwhere(self.attacked_mask).tolist()}
 
     def _fallback_attack(self):
-        for y in range(self.rows):
-            for x in range(self.cols):
-                if (x, y) not in self.attacked:
-                    return x, y
+        # Only reached once _pick_cell found no unattacked cell
         raise RuntimeError("No remaining attack positions")
 
     def _true_all_ships_sunk(self) -> bool:
         """Checks the actual state through hit counts"""
-        total_hits = sum(row.count('H') for row in self.enemy_board)
-        required_hits = sum(
-            spec['size'] * count 
-            for ship_id, count in self.ships_dict.items() 
-            for spec in [self.ship_metadata[ship_id]]
-        )
-        return total_hits >= required_hits
-
-    def _update_ship_count(self, x: int, y: int):
-        """Detects ship size and updates counts"""
-        ship_size = self._detect_ship_size(x, y)
+        return self._hit_count >= self._required_hits
+
+    def _update_ship_count(self, ship_cells: list[tuple[int, int]]):
+        """Removes the sunk ship from the remaining ships, by its shape or else by its size"""
+        ship_id = _SHIP_BY_CELLS.get(_normalize(ship_cells))
+        if ship_id is not None and self.ships_remaining.get(ship_id, 0) > 0:
+            self.ships_remaining[ship_id] -= 1
+            return
+        ship_size = len(ship_cells)
         for ship_id, size in self.ship_metadata.items():
             if size == ship_size and self.ships_remaining.get(ship_id, 0) > 0:
                 self.ships_remaining[ship_id] -= 1
@@ -162,48 +374,37 @@ class Strategy:
 
     def _detect_ship_size(self, x: int, y: int) -> int:
         """Helper method for tests - detects ship size"""
-        visited = set()
-        queue = [(x, y)]
-        size = 0
-        
-        while queue:
-            cx, cy = queue.pop(0)
-            if (cx, cy) in visited:
-                continue
-            visited.add((cx, cy))
-            
-            if self.enemy_board[cy][cx] == 'H':
-                size += 1
-                for dx, dy in [(-1,0), (1,0), (0,-1), (0,1)]:
-                    nx, ny = cx + dx, cy + dy
-                    if 0 <= nx < self.cols and 0 <= ny < self.rows:
-                        queue.append((nx, ny))
-        return size
+        count = _bfs_ship(self.enemy_board, x, y, self._bfs_gen, self._next_bfs_gen(),
+                          self._bfs_queue, _N4_OFFSETS)[0]
+        return int(count)
 
     def detect_ship_direction(self, x: int, y: int) -> list:
         """Detects probable ship direction based on neighboring hits"""
         directions = []
         
+        row = self.enemy_board[y]
+        col = self.enemy_board[:, x]
+        
         # Check horizontal direction
-        left = any(self.enemy_board[y][x-i] == 'H' for i in range(1, x+1))
-        right = any(self.enemy_board[y][x+i] == 'H' for i in range(1, self.cols-x))
+        left = (row[:x] == HIT).any()
+        right = (row[x+1:] == HIT).any()
         if left or right:
             directions.extend([(-1,0), (1,0)])
         
         # Check vertical direction
-        up = any(self.enemy_board[y-i][x] == 'H' for i in range(1, y+1))
-        down = any(self.enemy_board[y+i][x] == 'H' for i in range(1, self.rows-y))
+        up = (col[:y] == HIT).any()
+        down = (col[y+1:] == HIT).any()
         if up or down:
             directions.extend([(0,-1), (0,1)])
         
-        return directions if directions else [(-1,0),(1,0),(0,-1),(0,1)]
+        return directions if directions else list(_N4)
 
-    def get_enemy_board(self) -> list[list[str]]:
-        """Required by tests - returns a copy of the game board"""
-        return [row.copy() for row in self.enemy_board]
+    def get_enemy_board(self) -> np.ndarray:
+        """Required by tests - returns a copy of the game board ('?', 'H', 'M'), indexed [y][x]"""
+        return _SYMBOLS[self.enemy_board]
 
     def get_remaining_ships(self) -> dict[int, int]:
-        """Required by tests - returns remaining ships"""
+        """Required by tests - returns a copy of the remaining ships"""
         return self.ships_remaining.copy()
 
     def all_ships_sunk(self) -> bool:
@@ -211,61 +412,25 @@ class Strategy:
         return sum(self.ships_remaining.values()) == 0
 
     def analyze_ship_shape(self, x: int, y: int) -> tuple[int, str]:
-        visited = set()
-        queue = [(x, y)]
-        min_x, max_x = x, x
-        min_y, max_y = y, y
-        cells = []
-        
-        while queue:
-            cx, cy = queue.pop(0)
-            if (cx, cy) in visited:
-                continue
-            visited.add((cx, cy))
-            cells.append((cx, cy))
-            
-            min_x = min(min_x, cx)
-            max_x = max(max_x, cx)
-            min_y = min(min_y, cy)
-            max_y = max(max_y, cy)
-            
-            for dx, dy in [(-1,0),(1,0),(0,-1),(0,1),(-1,-1),(1,-1),(-1,1),(1,1)]:
-                nx, ny = cx + dx, cy + dy
-                if 0 <= nx < self.cols and 0 <= ny < self.rows:
-                    if self.enemy_board[ny][nx] == 'H' and (nx, ny) not in visited:
-                        queue.append((nx, ny))
+        """
+        Classifies the group of hits (x, y) belongs to, following diagonal neighbours too.
+        Returns (size, shape name); (0, "Unknown") if (x, y) is not a hit.
+        """
+        count, min_x, max_x, min_y, max_y = _bfs_ship(
+            self.enemy_board, x, y, self._bfs_gen, self._next_bfs_gen(), self._bfs_queue, _N8_OFFSETS)
+        if not count:
+            return 0, "Unknown"
+        min_x, max_x, min_y, max_y = int(min_x), int(max_x), int(min_y), int(max_y)
+        cells = self._bfs_queue[:count].tolist()
 
-        norm_cells = [(x - min_x, y - min_y) for (x, y) in cells]
+        norm_cells = frozenset((x - min_x, y - min_y) for (x, y) in cells)
         width = max_x - min_x + 1  
         height = max_y - min_y + 1
         size = len(norm_cells)
 
-        if size == 6 and width >= 4 and height >= 2:
-            middle_x = (width - 1) / 2
-            if all((x, 0) in norm_cells for x in range(4)) and \
-               (middle_x, 1) in norm_cells and (middle_x, 2) in norm_cells:
-                return 6, "TT"
-
-        if size == 4 and width == 3 and height == 2:
-            if {(0,0), (1,0), (1,1), (2,1)}.issubset(norm_cells) or \
-               {(0,1), (1,1), (1,0), (2,0)}.issubset(norm_cells):
-                return 4, "Z"
-
-        if size == 3 and (width == 3 and height == 1) or (height == 3 and width == 1):
-            return 3, "I"
-        elif size == 3 and (width == 2 and height == 2):
-            return 3, "L"
-
-        if size == 4:
-            main_axis = 'x' if width > height else 'y'
-            if main_axis == 'x':
-                middle = width // 2
-                if any((middle, y) in norm_cells for y in range(1, height)):
-                    return 4, "T"
-            else:
-                middle = height // 2
-                if any((x, middle) in norm_cells for x in range(1, width)):
-                    return 4, "T"
+        for shape_cells, shape_name in _SHAPE_TABLE.get((size, width, height), ()):
+            if norm_cells == shape_cells:
+                return size, shape_name
 
         if width == 1 or height == 1:
             return size, "I"
@@ -152,6 +152,15 @@ def test_place_ships_all_seven(all_seven_ships: BoardSetup):
     for ship_id in range(1, 8):
         assert ship_id in found_ids, f"Ship ID={ship_id} should appear on the board"
 
+def test_place_ships_impossible_layout():
+    """
+    A length-4 ship fits a 3x3 board by area but never by shape.
+    place_ships() should give up with a RuntimeError instead of retrying forever.
+    """
+    board = BoardSetup(rows=3, cols=3, ships_dict={3: 1})
+    with pytest.raises(RuntimeError):
+        board.place_ships()
+
 # -----------------------------------------------------------------------------
 # Ship Detection Helpers
 # -----------------------------------------------------------------------------
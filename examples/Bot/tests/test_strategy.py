@@ -73,6 +73,15 @@ def test_get_next_attack_in_range(small_strategy: Strategy):
         assert 0 <= x < small_strategy.cols, f"Returned x={x} out of range"
         assert 0 <= y < small_strategy.rows, f"Returned y={y} out of range"
 
+def test_next_attack_follows_up_hit(bigger_strategy: Strategy):
+    """
+    After a hit that did not sink anything, the next attack must be
+    an orthogonal neighbour of that hit (the ship continues there).
+    """
+    bigger_strategy.register_attack(4, 4, is_hit=True, is_sunk=False)
+    x, y = bigger_strategy.get_next_attack()
+    assert abs(x - 4) + abs(y - 4) == 1
+
 # -----------------------------------------------------------------------------
 # register_attack() - Hits and Misses (no sunk)
 # -----------------------------------------------------------------------------
@@ -189,3 +198,40 @@ def test_sink_two_ships_small_strategy(small_strategy: Strategy):
     small_strategy.register_attack(2, 3, is_hit=True, is_sunk=True)
     assert sum(small_strategy.get_remaining_ships().values()) == 0, "No ships left"
     assert small_strategy.all_ships_sunk(), "All ships should be sunk now"
+
+def test_sink_ships_matched_by_shape():
+    """
+    Size-4 ships share a size, so a sunk ship is matched by its shape:
+    sinking a T and an L must decrement IDs 4 and 5, not the I4 (ID=3).
+    """
+    strategy = Strategy(rows=8, cols=8, ships_dict={3: 1, 4: 1, 5: 1})
+
+    # T: three in a row with one cell below the middle
+    for x, y in [(0, 0), (1, 0), (2, 0)]:
+        strategy.register_attack(x, y, is_hit=True, is_sunk=False)
+    strategy.register_attack(1, 1, is_hit=True, is_sunk=True)
+    assert strategy.get_remaining_ships() == {3: 1, 4: 0, 5: 1}
+
+    # L: vertical leg with a foot to the right
+    for x, y in [(5, 0), (5, 1), (5, 2)]:
+        strategy.register_attack(x, y, is_hit=True, is_sunk=False)
+    strategy.register_attack(6, 2, is_hit=True, is_sunk=True)
+    assert strategy.get_remaining_ships() == {3: 1, 4: 0, 5: 0}
+    assert not strategy.all_ships_sunk()
+
+# -----------------------------------------------------------------------------
+# Shape Analysis Tests
+# -----------------------------------------------------------------------------
+
+def test_analyze_ship_shape_rotations(bigger_strategy: Strategy):
+    """
+    Hits forming a T pointing left (vertical bar at x=3, stem at (2,2))
+    and a TT rotated upright must be classified regardless of orientation.
+    """
+    for x, y in [(3, 1), (3, 2), (3, 3), (2, 2)]:
+        bigger_strategy.register_attack(x, y, is_hit=True, is_sunk=False)
+    assert bigger_strategy.analyze_ship_shape(3, 1) == (4, "T")
+
+    for x, y in [(6, 3), (6, 4), (6, 5), (6, 6), (7, 4), (7, 5)]:
+        bigger_strategy.register_attack(x, y, is_hit=True, is_sunk=False)
+    assert bigger_strategy.analyze_ship_shape(7, 5) == (6, "TT")